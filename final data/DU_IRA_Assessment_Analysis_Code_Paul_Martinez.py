@@ -15,38 +15,127 @@ Purpose:
     More specifically, a table/graph per sheet. 
 
 Notes:
-    - Dependencies: pandas, numpy, statsmodels, matplotlib, seaborn (optional for visuals)
+    - Dependencies: pandas, numpy, pyarrow, scipy, matplotlib, seaborn (optional for visuals)
     - Input: student_level_final_data.csv from the "final data" folder
     - Output: statistical results, tables, and figures
+      (REPORT_FORMAT=xlsx workbook by default; REPORT_FORMAT=parquet for a zip of Parquet tables + charts)
+    - SAVE_CHARTS=0 skips chart rendering; histogram bin-count tables are reported instead
     - This script assumes the cleaning pipeline has already been run and exported the final dataset.
 """
 
 # -------- Setup --------
+import io
 import os
+import zipfile
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from statsmodels.stats.proportion import proportions_ztest
+from scipy.stats import norm
+from xlsxwriter.utility import xl_cell_to_rowcol
 
 FINAL_DATA_FOLDER = r"C:\Users\paul6\OneDrive\Desktop\final data"
 in_path  = os.path.join(FINAL_DATA_FOLDER, "student_level_final_data.csv")
 out_xlsx = os.path.join(FINAL_DATA_FOLDER, "DU_IRA_Assessment_Report.xlsx")
+out_zip  = os.path.join(FINAL_DATA_FOLDER, "DU_IRA_Assessment_Report.zip")
 os.makedirs(FINAL_DATA_FOLDER, exist_ok=True)
 
-df = pd.read_csv(in_path)
+# Report output: "xlsx" (one workbook, default) or "parquet" (zip of one .parquet per table + charts)
+REPORT_FORMAT = os.environ.get("REPORT_FORMAT", "xlsx").strip().lower()
+if REPORT_FORMAT not in {"xlsx", "parquet"}:
+    raise ValueError(f"[FATAL] REPORT_FORMAT must be 'xlsx' or 'parquet', got {REPORT_FORMAT!r}")
+
+# Charts: SAVE_CHARTS=0 skips matplotlib entirely; histogram bin-count tables are written either way
+SAVE_CHARTS = os.environ.get("SAVE_CHARTS", "1") == "1"
+if SAVE_CHARTS:
+    import matplotlib.pyplot as plt
+
+# Arrow-backed read (multithreaded parser); keys kept as text
+df = pd.read_csv(in_path, engine="pyarrow", dtype_backend="pyarrow",
+                 dtype={"id": "string[pyarrow]", "term_code": "string[pyarrow]"})
 
 # -------- Helper: write sheet + (optional) embed image --------
-def write_sheet(writer, sheet_name, table_df, image_path=None, image_cell="G2", img_scale=1.0):
+def write_sheet(writer, sheet_name, table_df, image_path=None, image_cell="G2", img_scale=1.0, fallback_df=None):
     table_df.to_excel(writer, sheet_name=sheet_name, index=False)
-    if image_path is not None and os.path.exists(image_path):
+    if SAVE_CHARTS and image_path is not None and os.path.exists(image_path):
         ws = writer.sheets[sheet_name]
         ws.insert_image(image_cell, image_path, {"x_scale": img_scale, "y_scale": img_scale})
+    elif fallback_df is not None:
+        # No chart rendered: put its bin-count table where the image would go
+        row, col = xl_cell_to_rowcol(image_cell)
+        fallback_df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=row, startcol=col)
+
+# -------- Helper: write tables + charts as a zipped Parquet bundle --------
+def write_parquet_bundle(zip_path, tables, image_paths=()):
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, table_df in tables.items():
+            # Mixed-type text columns (e.g., metric/value tables with a note) are stored as strings
+            table_df = table_df.copy()
+            for col in table_df.columns[table_df.dtypes == object]:
+                if table_df[col].map(type).nunique() > 1:
+                    table_df[col] = table_df[col].astype(str)
+            buf = io.BytesIO()
+            table_df.to_parquet(buf, index=False)
+            zf.writestr(f"{name}.parquet", buf.getvalue())
+        for image_path in image_paths:
+            if os.path.exists(image_path):
+                zf.write(image_path, os.path.basename(image_path))
+
+# -------- Helper: histogram bin counts as a table --------
+def bin_labels_for(edges, integer=False):
+    if integer:
+        # Edges sit on half-integers, so each bin holds whole values: "18" or "25–26"
+        lo, hi = np.ceil(edges[:-1]).astype(int), np.floor(edges[1:]).astype(int)
+        return [f"{a}" if a == b else f"{a}–{b}" for a, b in zip(lo, hi)]
+    # np.histogram bins are half-open except the last, which includes the right edge;
+    # print at the grid's own precision (at least 2 decimals) so labels are the exact edges
+    dp = next((d for d in range(2, 7) if np.allclose(np.round(edges, d), edges, rtol=0, atol=1e-9)), 6)
+    labels = [f"[{edges[i]:.{dp}f}, {edges[i+1]:.{dp}f})" for i in range(len(edges)-1)]
+    labels[-1] = labels[-1][:-1] + "]"
+    return labels
+
+def hist_table(counts, edges, integer=False):
+    return pd.DataFrame({"bin": bin_labels_for(edges, integer), "count": counts})
+
+# -------- Helper: histogram binning --------
+def choose_bins(series, cap=50):
+    # Square-root rule on non-missing count, floored at 10 and capped so large cohorts don't over-resolve
+    return min(cap, max(10, int(np.sqrt(series.notna().sum()))))
+
+def bin_edges(series, cap=50, integer=False, scale=None):
+    # Equal-width edges on a round grid over the observed range, or over scale=(lo, hi) for bounded
+    # variables like GPA; integer=True centres whole-number bins on each value
+    vals = series.dropna().to_numpy(dtype=float)
+    if scale is not None:
+        lo, hi = float(scale[0]), float(scale[1])
+    elif vals.size == 0:
+        return np.linspace(0.0, 1.0, choose_bins(series, cap) + 1)
+    else:
+        lo, hi = vals.min(), vals.max()
+    if integer:
+        # One bin per value; past the cap, widen by whole units instead of splitting values
+        width = int(np.ceil((hi - lo + 1) / cap))
+        return np.arange(lo, hi + width + 1, width) - 0.5
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5  # same widening plt.hist applies to constant data
+    # Width and origin are whole multiples of a decimal step (e.g., 0.08 from 0.00), not raw min/max
+    k = choose_bins(series, cap)
+    step = 10.0 ** np.floor(np.log10((hi - lo) / k))
+    width = np.ceil(round((hi - lo) / k / step, 6)) * step
+    origin = np.floor(round(lo / width, 6)) * width
+    while np.ceil(round((hi - origin) / width, 6)) > k:
+        width += step
+        origin = np.floor(round(lo / width, 6)) * width
+    n = int(np.ceil(round((hi - origin) / width, 6)))
+    # Snap off float noise (e.g., 2.8000000000000003) so values at an edge land in the bin it opens
+    return np.round(origin + width * np.arange(n + 1), 6)
+
+# -------- Shared scalar counts (one aggregation pass; reused in sections 1 and 8) --------
+summary = df.agg({"persisted_w3_to_end": "sum", "undeclared_to_declared": "sum"}).astype(int)
 
 # ==============================
 # 1) Persistence rate (table)
 # ==============================
 total_students = len(df)
-persisted = int(df["persisted_w3_to_end"].sum())
+persisted = int(summary["persisted_w3_to_end"])
 persistence_rate = persisted / total_students if total_students else np.nan
 
 tbl_persistence = pd.DataFrame({
@@ -57,24 +146,36 @@ tbl_persistence = pd.DataFrame({
 # ==============================================
 # 2) Gender difference in persistence (tables)
 # ==============================================
-by_gender = (df.groupby("gender")["persisted_w3_to_end"]
-               .agg(n_total="count", n_persisted="sum"))
-by_gender["persist_rate"] = (by_gender["n_persisted"] / by_gender["n_total"]).round(6)
-tbl_gender = by_gender.reset_index()
-
-# Two-proportion z-test for Male vs Female (if both present)
-ztest_table = pd.DataFrame(columns=["comparison", "z_stat", "p_value"])
-if {"Male","Female"}.issubset(set(tbl_gender["gender"])):
-    male = tbl_gender.loc[tbl_gender["gender"]=="Male", ["n_persisted","n_total"]].iloc[0]
-    female = tbl_gender.loc[tbl_gender["gender"]=="Female", ["n_persisted","n_total"]].iloc[0]
-    z_stat, p_val = proportions_ztest(count=[male["n_persisted"], female["n_persisted"]],
-                                      nobs=[male["n_total"], female["n_total"]])
-    ztest_table = pd.DataFrame([{
-        "comparison": "Male vs Female",
-        "z_stat": round(float(z_stat), 6),
-        "p_value": round(float(p_val), 6)
-    }])
-else:
+# Few genders: integer codes + bincount instead of a hash groupby (sorted, missing gender excluded)
+gender_codes, genders = pd.factorize(df["gender"], sort=True)
+genders = np.asarray(genders, dtype=object)  # sorted; row order of tbl_gender and the z-test pairs below
+persisted_flag = df["persisted_w3_to_end"].to_numpy(dtype=float, na_value=np.nan)
+keep = (gender_codes >= 0) & ~np.isnan(persisted_flag)
+tbl_gender = pd.DataFrame({
+    "gender": genders,
+    "n_total": np.bincount(gender_codes[keep], minlength=len(genders)),
+    "n_persisted": np.bincount(gender_codes[keep], weights=persisted_flag[keep], minlength=len(genders)).astype(int)
+})
+tbl_gender["persist_rate"] = (tbl_gender["n_persisted"] / tbl_gender["n_total"]).round(6)
+
+# Pooled two-proportion z-tests for every pair of genders, broadcast in one shot
+# (same statistic as statsmodels' proportions_ztest, two-sided)
+n = tbl_gender["n_total"].to_numpy(dtype=float)
+x = tbl_gender["n_persisted"].to_numpy(dtype=float)
+with np.errstate(divide="ignore", invalid="ignore"):
+    p_pool = (x[:, None] + x[None, :]) / (n[:, None] + n[None, :])
+    se = np.sqrt(p_pool * (1 - p_pool) * (1 / n[:, None] + 1 / n[None, :]))
+    z = (x[:, None] / n[:, None] - x[None, :] / n[None, :]) / se
+pvals = 2 * norm.sf(np.abs(z))
+
+# Each pair once, later group vs earlier in sorted order (e.g., "Male vs Female")
+i, j = np.tril_indices(len(genders), k=-1)
+ztest_table = pd.DataFrame({
+    "comparison": [f"{a} vs {b}" for a, b in zip(genders[i], genders[j])],
+    "z_stat": z[i, j].round(6),
+    "p_value": pvals[i, j].round(6)
+})
+if ztest_table.empty:
     ztest_table = pd.DataFrame([{"comparison": "Male vs Female", "z_stat": np.nan, "p_value": np.nan}])
 
 # =====================================================
@@ -88,8 +189,10 @@ gender_counts = (df["gender"].value_counts(dropna=False)
                  .rename_axis("gender").reset_index(name="count"))
 gender_counts["percent"] = (gender_counts["count"] / total_students * 100).round(2)
 
-race_gender_counts = pd.crosstab(df["race_ethnicity"], df["gender"]).reset_index()
-race_gender_pct = (pd.crosstab(df["race_ethnicity"], df["gender"], normalize="index")*100
+# One grouping pass; row percentages derived from the same counts
+race_gender = df.groupby(["race_ethnicity", "gender"]).size().unstack(fill_value=0)
+race_gender_counts = race_gender.reset_index()
+race_gender_pct = (race_gender.div(race_gender.sum(axis=1), axis=0)*100
                    ).round(2).reset_index()
 
 # =================================
@@ -99,15 +202,21 @@ age_summary = df["age"].describe().round(2).rename_axis("stat").reset_index(name
 
 # Histogram
 age_plot = os.path.join(FINAL_DATA_FOLDER, "age_distribution.png")
-plt.figure(figsize=(8,5))
-plt.hist(df["age"].dropna(), bins=10, edgecolor="black")
-plt.title("Age Distribution")
-plt.xlabel("Age")
-plt.ylabel("Number of Students")
-plt.grid(axis="y", linestyle="--", alpha=0.7)
-plt.tight_layout()
-plt.savefig(age_plot, dpi=150)
-plt.close()
+# Counts binned in numpy; matplotlib only draws the bars
+# Whole-year bars; cap above the observed age span so every year keeps its own bar
+age_counts, age_edges = np.histogram(df["age"].dropna().to_numpy(dtype=float),
+                                     bins=bin_edges(df["age"], cap=100, integer=True))
+age_bin_counts = hist_table(age_counts, age_edges, integer=True)
+if SAVE_CHARTS:
+    plt.figure(figsize=(8,5))
+    plt.bar(age_edges[:-1], age_counts, width=np.diff(age_edges), align="edge", edgecolor="black")
+    plt.title("Age Distribution")
+    plt.xlabel("Age")
+    plt.ylabel("Number of Students")
+    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(age_plot, dpi=150)
+    plt.close()
 
 # ===============================================
 # 5) Term GPA distribution (table + optional fig)
@@ -119,15 +228,20 @@ gpa_counts["percent"] = (gpa_counts["count"] / total_students * 100).round(2)
 
 # Histogram
 gpa_plot = os.path.join(FINAL_DATA_FOLDER, "gpa_distribution.png")
-plt.figure(figsize=(8,5))
-plt.hist(df["term_gpa"].dropna(), bins=10, edgecolor="black")
-plt.title("Term GPA Distribution")
-plt.xlabel("GPA")
-plt.ylabel("Number of Students")
-plt.grid(axis="y", linestyle="--", alpha=0.7)
-plt.tight_layout()
-plt.savefig(gpa_plot, dpi=150)
-plt.close()
+# Fixed 0–4 GPA scale (decimal-aligned edges), same grid family as the degree plot
+gpa_hist, gpa_edges = np.histogram(df["term_gpa"].dropna().to_numpy(dtype=float),
+                                   bins=bin_edges(df["term_gpa"], scale=(0, 4.0)))
+gpa_bin_counts = hist_table(gpa_hist, gpa_edges)
+if SAVE_CHARTS:
+    plt.figure(figsize=(8,5))
+    plt.bar(gpa_edges[:-1], gpa_hist, width=np.diff(gpa_edges), align="edge", edgecolor="black")
+    plt.title("Term GPA Distribution")
+    plt.xlabel("GPA")
+    plt.ylabel("Number of Students")
+    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    plt.tight_layout()
+    plt.savefig(gpa_plot, dpi=150)
+    plt.close()
 
 # ======================================
 # 6) Average GPA by program (table only)
@@ -139,36 +253,50 @@ gpa_by_program = (df.groupby("program", dropna=False)["term_gpa"].mean()
 # 7) Visual: course grade distributions by degree (fig+tbl)
 # =========================================================
 target_degrees = ["BA", "BS", "BM", "BFA"]
-df_deg = df[df["degree"].isin(target_degrees)].copy()
+# Masked arrays only; no copy of the full frame
+deg_mask = df["degree"].isin(target_degrees)
+deg_gpa = df.loc[deg_mask, "term_gpa"].to_numpy(dtype=float, na_value=np.nan)
+deg_names = df.loc[deg_mask, "degree"].to_numpy(dtype=object)
 
 # Stacked histo via matplotlib (simple + reliable)
 degree_plot = os.path.join(FINAL_DATA_FOLDER, "degree_grade_distributions.png")
-plt.figure(figsize=(10,6))
-bins = np.linspace(0, 4.0, 21)  # 0.2 GPA bins
-for deg in target_degrees:
-    plt.hist(df_deg.loc[df_deg["degree"]==deg, "term_gpa"].dropna(),
-             bins=bins, alpha=0.7, label=deg, edgecolor="black")
-plt.title("Course Grade Distribution by Broad Degree Level")
-plt.xlabel("Term GPA")
-plt.ylabel("Number of Students")
-plt.grid(axis="y", linestyle="--", alpha=0.7)
-plt.legend(title="Degree", bbox_to_anchor=(1.05, 1), loc="upper left", borderaxespad=0)
-plt.tight_layout()
-plt.savefig(degree_plot, dpi=150)
-plt.close()
+bins = bin_edges(pd.Series(deg_gpa), scale=(0, 4.0))  # fixed 0–4 GPA scale, snapped edges
+# One row of bin counts per degree, binned in numpy before plotting
+deg_counts = np.vstack([
+    np.histogram(deg_gpa[(deg_names == deg) & ~np.isnan(deg_gpa)], bins=bins)[0]
+    for deg in target_degrees
+])
+if SAVE_CHARTS:
+    plt.figure(figsize=(10,6))
+    for deg, counts in zip(target_degrees, deg_counts):
+        plt.bar(bins[:-1], counts, width=np.diff(bins), align="edge",
+                alpha=0.7, label=deg, edgecolor="black")
+    plt.title("Course Grade Distribution by Broad Degree Level")
+    plt.xlabel("Term GPA")
+    plt.ylabel("Number of Students")
+    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    plt.legend(title="Degree", bbox_to_anchor=(1.05, 1), loc="upper left", borderaxespad=0)
+    plt.tight_layout()
+    plt.savefig(degree_plot, dpi=150)
+    plt.close()
 
 # Underlying counts table (so the visual has tabular backing)
-bin_labels = [f"[{round(bins[i],1)}, {round(bins[i+1],1)})" for i in range(len(bins)-1)]
-df_deg["gpa_bin"] = pd.cut(df_deg["term_gpa"], bins=bins, labels=bin_labels, include_lowest=True, right=False)
-degree_bin_counts = (df_deg.groupby(["degree","gpa_bin"]).size()
-                     .reset_index(name="count"))
+bin_labels = bin_labels_for(bins)
+# Reuse the plotted counts; list non-empty bins, degrees in sorted order
+degree_bin_counts = pd.DataFrame({
+    "degree": np.repeat(target_degrees, len(bin_labels)),
+    "gpa_bin": np.tile(bin_labels, len(target_degrees)),
+    "count": deg_counts.ravel()
+})
+degree_bin_counts = (degree_bin_counts[degree_bin_counts["count"] > 0]
+                     .sort_values("degree", kind="stable").reset_index(drop=True))
 
 # ====================================================================
 # 8) Proportion: WK3 undeclared → declared by EOT (table, no graphic)
 # ====================================================================
 # Final dataset includes boolean 'undeclared_to_declared'.
-n_undecl_to_decl = int(df["undeclared_to_declared"].sum())
-persisters = int(df["persisted_w3_to_end"].sum())
+n_undecl_to_decl = int(summary["undeclared_to_declared"])
+persisters = persisted
 
 # Report practical rates we can compute directly from the final dataset
 prop_of_total = n_undecl_to_decl / total_students if total_students else np.nan
@@ -185,44 +313,68 @@ undecl_tbl = pd.DataFrame({
 })
 
 # =======================
-# Write Excel (1 workbook)
+# Write report (1 workbook, or 1 Parquet bundle)
 # =======================
-with pd.ExcelWriter(out_xlsx, engine="xlsxwriter") as writer:
-    write_sheet(writer, "Persistence rate", tbl_persistence)
-    write_sheet(writer, "Gender diff (tables)", tbl_gender)
-    # put z-test on a second table in same sheet (rows after)
-    tbl_gender.to_excel(writer, sheet_name="Gender diff (tables)", index=False)
-    ws = writer.sheets["Gender diff (tables)"]
-    start_row = len(tbl_gender) + 3
-    ws.write_string(start_row, 0, "Two-proportion z-test (Male vs Female)")
-    ztest_table.to_excel(writer, sheet_name="Gender diff (tables)", index=False, startrow=start_row+1)
-
-    write_sheet(writer, "Race makeup", race_counts)
-    write_sheet(writer, "Gender makeup", gender_counts)
-    write_sheet(writer, "Race x Gender (counts)", race_gender_counts)
-    write_sheet(writer, "Race x Gender (pct)", race_gender_pct)
-
-    write_sheet(writer, "Age distribution", age_summary, image_path=age_plot, image_cell="H2", img_scale=1.0)
-
-    write_sheet(writer, "GPA distribution", gpa_summary, image_path=gpa_plot, image_cell="H2", img_scale=1.0)
-    # Also include the GPA counts table on the same sheet below
-    gpa_summary.to_excel(writer, sheet_name="GPA distribution", index=False)
-    ws = writer.sheets["GPA distribution"]
-    start_row = len(gpa_summary) + 3
-    ws.write_string(start_row, 0, "GPA counts")
-    gpa_counts.to_excel(writer, sheet_name="GPA distribution", index=False, startrow=start_row+1)
-
-    write_sheet(writer, "Avg GPA by program", gpa_by_program)
-
-    write_sheet(writer, "Degree grade distributions", degree_bin_counts, image_path=degree_plot, image_cell="J2", img_scale=1.0)
-
-    write_sheet(writer, "Undecl→Decl proportion", undecl_tbl)
-
-print(f"[OK] Report written: {out_xlsx}")
-print("Charts saved to:")
-print(" -", age_plot)
-print(" -", gpa_plot)
-print(" -", degree_plot)
+if REPORT_FORMAT == "parquet":
+    report_tables = {
+        "persistence_rate": tbl_persistence,
+        "gender_diff": tbl_gender,
+        "gender_ztest": ztest_table,
+        "race_makeup": race_counts,
+        "gender_makeup": gender_counts,
+        "race_x_gender_counts": race_gender_counts,
+        "race_x_gender_pct": race_gender_pct,
+        "age_distribution": age_summary,
+        "age_bin_counts": age_bin_counts,
+        "gpa_distribution": gpa_summary,
+        "gpa_counts": gpa_counts,
+        "gpa_bin_counts": gpa_bin_counts,
+        "avg_gpa_by_program": gpa_by_program,
+        "degree_grade_distributions": degree_bin_counts,
+        "undecl_to_decl_proportion": undecl_tbl,
+    }
+    write_parquet_bundle(out_zip, report_tables, [age_plot, gpa_plot, degree_plot] if SAVE_CHARTS else [])
+    print(f"[OK] Report written: {out_zip}")
+else:
+    with pd.ExcelWriter(out_xlsx, engine="xlsxwriter") as writer:
+        write_sheet(writer, "Persistence rate", tbl_persistence)
+        write_sheet(writer, "Gender diff (tables)", tbl_gender)
+        # put z-test on a second table in same sheet (rows after)
+        tbl_gender.to_excel(writer, sheet_name="Gender diff (tables)", index=False)
+        ws = writer.sheets["Gender diff (tables)"]
+        start_row = len(tbl_gender) + 3
+        ws.write_string(start_row, 0, "Two-proportion z-tests (pairwise by gender)")
+        ztest_table.to_excel(writer, sheet_name="Gender diff (tables)", index=False, startrow=start_row+1)
+
+        write_sheet(writer, "Race makeup", race_counts)
+        write_sheet(writer, "Gender makeup", gender_counts)
+        write_sheet(writer, "Race x Gender (counts)", race_gender_counts)
+        write_sheet(writer, "Race x Gender (pct)", race_gender_pct)
+
+        write_sheet(writer, "Age distribution", age_summary, image_path=age_plot, image_cell="H2", img_scale=1.0,
+                    fallback_df=age_bin_counts)
+
+        write_sheet(writer, "GPA distribution", gpa_summary, image_path=gpa_plot, image_cell="H2", img_scale=1.0,
+                    fallback_df=gpa_bin_counts)
+        # Also include the GPA counts table on the same sheet below
+        gpa_summary.to_excel(writer, sheet_name="GPA distribution", index=False)
+        ws = writer.sheets["GPA distribution"]
+        start_row = len(gpa_summary) + 3
+        ws.write_string(start_row, 0, "GPA counts")
+        gpa_counts.to_excel(writer, sheet_name="GPA distribution", index=False, startrow=start_row+1)
+
+        write_sheet(writer, "Avg GPA by program", gpa_by_program)
+
+        write_sheet(writer, "Degree grade distributions", degree_bin_counts, image_path=degree_plot, image_cell="J2", img_scale=1.0)
+
+        write_sheet(writer, "Undecl→Decl proportion", undecl_tbl)
+
+    print(f"[OK] Report written: {out_xlsx}")
+if SAVE_CHARTS:
+    print("Charts saved to:")
+    print(" -", age_plot)
+    print(" -", gpa_plot)
+    print(" -", degree_plot)
 
 #Including code to not save graphs as well just csv with all content
 import os
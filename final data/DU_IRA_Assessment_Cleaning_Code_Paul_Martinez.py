@@ -12,16 +12,15 @@ Purpose:
     Step-by-step reproduction instructions are included for future analysts.
 
 Notes:
-    - Dependencies: pandas, numpy, statsmodels (matplotlib if figures)
+    - Dependencies: pandas, numpy, pyarrow
     - Modular design for re-running with new term data
-    - Statistical test: two-proportion z-test via statsmodels
     - Output: student_level_final_data.csv with aggregated fields
 """
 
 # -----------------------------
 # Step 1 — Install Required Packages (PowerShell, Python 3.13)
 # -----------------------------
-# py -3.13 -m pip install pandas numpy 
+# py -3.13 -m pip install pandas numpy pyarrow
 
 # -----------------------------
 # Imports
@@ -48,10 +47,31 @@ for file_path in [fall_enrollment_path, grades_path, program_data_path]:
     else:
         print(f"[OK] Found: {file_path}")
 
+# Columns the pipeline reads (projection at load; extra columns in the files are skipped)
+ENROLLMENT_COLS = ["id", "term_code", "census", "race_desc", "legal_sex_desc", "ethn_desc",
+                   "visa_desc", "college", "degr", "majr", "birth_date"]
+GRADES_COLS     = ["id", "term_code", "final_course_grade"]
+PROGRAM_COLS    = ["COLLEGE", "DEGREE", "MAJOR", "PROGRAM"]
+
+# Header check before reading, so a missing column fails with a clear message
+for file_path, required, name in [(fall_enrollment_path, ENROLLMENT_COLS, "fall_enrollment"),
+                                  (grades_path, GRADES_COLS, "grades"),
+                                  (program_data_path, PROGRAM_COLS, "program_data")]:
+    header = pd.read_csv(file_path, nrows=0).columns
+    missing = [col for col in required if col not in header]
+    if missing:
+        raise KeyError(f"[FATAL] {', '.join(repr(col) for col in missing)} not found in {name}")
+
 # Load
-fall_enrollment = pd.read_csv(fall_enrollment_path)
-grades          = pd.read_csv(grades_path)
-program_data    = pd.read_csv(program_data_path)
+# Arrow-backed reads: multithreaded parser, columnar strings; keys kept as text
+KEY_DTYPES = {"id": "string[pyarrow]", "term_code": "string[pyarrow]"}
+fall_enrollment = pd.read_csv(fall_enrollment_path, engine="pyarrow", dtype_backend="pyarrow",
+                              usecols=ENROLLMENT_COLS, dtype=KEY_DTYPES)
+grades          = pd.read_csv(grades_path, engine="pyarrow", dtype_backend="pyarrow",
+                              usecols=GRADES_COLS,
+                              dtype={**KEY_DTYPES, "final_course_grade": "string[pyarrow]"})
+program_data    = pd.read_csv(program_data_path, engine="pyarrow", dtype_backend="pyarrow",
+                              usecols=PROGRAM_COLS)
 
 print(
     "Loaded shapes -> "
@@ -63,29 +83,38 @@ print(
 # -----------------------------
 # Step 3 — Standardize keys, check coverage, and merge by (id, term_code)
 # -----------------------------
+def _norm_key(s, upper=False):
+    # Single cast to Arrow strings so trim/uppercase run as one vectorized pass each
+    s = s.astype("string[pyarrow]").str.strip()
+    return s.str.upper() if upper else s
+
 # Normalize join keys (string + trim)
-for df, name in [(fall_enrollment, "fall_enrollment"), (grades, "grades")]:
+for df in [fall_enrollment, grades]:
     for col in ["id", "term_code"]:
-        if col not in df.columns:
-            raise KeyError(f"[FATAL] '{col}' not found in {name}")
-        df[col] = df[col].astype(str).str.strip()
+        df[col] = _norm_key(df[col])
+
+# Shared categorical keys across both files: later joins/groupbys hash int codes, not strings
+for col in ["id", "term_code"]:
+    key_dtype = pd.CategoricalDtype(pd.Categorical(pd.concat([fall_enrollment[col], grades[col]])).categories)
+    fall_enrollment[col] = fall_enrollment[col].astype(key_dtype)
+    grades[col] = grades[col].astype(key_dtype)
 
 # Visibility on terms present
 print("[INFO] Terms in enrollment:", sorted(fall_enrollment["term_code"].unique())[:10])
 print("[INFO] Terms in grades:    ", sorted(grades["term_code"].unique())[:10])
 
 # Coverage check (id, term_code)
-enroll_keys = set(map(tuple, fall_enrollment[["id", "term_code"]].values))
-grade_keys  = set(map(tuple, grades[["id", "term_code"]].values))
-matched     = enroll_keys & grade_keys
+enroll_keys = pd.MultiIndex.from_frame(fall_enrollment[["id", "term_code"]]).unique()
+grade_keys  = pd.MultiIndex.from_frame(grades[["id", "term_code"]]).unique()
+matched     = enroll_keys.intersection(grade_keys)
 
 print("[COVERAGE] (id, term_code) match results")
 print(f"  enrollment keys: {len(enroll_keys)}")
 print(f"  grades keys:     {len(grade_keys)}")
 print(f"  matched:         {len(matched)} ({len(matched)/max(len(enroll_keys),1):.1%} of enrollment)")
 
-miss_enroll_has_no_grades = list(enroll_keys - grade_keys)[:10]
-miss_grades_no_enroll     = list(grade_keys - enroll_keys)[:10]
+miss_enroll_has_no_grades = enroll_keys.difference(grade_keys)[:10].tolist()
+miss_grades_no_enroll     = grade_keys.difference(enroll_keys)[:10].tolist()
 if miss_enroll_has_no_grades:
     print("  sample enrollment->no grades (up to 10):", miss_enroll_has_no_grades)
 if miss_grades_no_enroll:
@@ -93,7 +122,7 @@ if miss_grades_no_enroll:
 
 # Aggregate grades to term (avoid row multiplication; GPA later)
 grades_term = (
-    grades.groupby(["id", "term_code"], as_index=False)
+    grades.groupby(["id", "term_code"], as_index=False, observed=True)
           .agg(course_count=("id", "size"))
 )
 
@@ -114,13 +143,13 @@ print("  course_count nulls:", enroll_plus_gr["course_count"].isna().sum(), "(no
 # Step 4 — Attach Program (program_data) via (college, degree, major)
 # -----------------------------
 # Standardize text keys (trim + uppercase) on both sides to ensure a reliable match
-enroll_plus_gr["college_key"] = enroll_plus_gr["college"].astype(str).str.strip().str.upper()
-enroll_plus_gr["degree_key"]  = enroll_plus_gr["degr"].astype(str).str.strip().str.upper()
-enroll_plus_gr["major_key"]   = enroll_plus_gr["majr"].astype(str).str.strip().str.upper()
+enroll_plus_gr["college_key"] = _norm_key(enroll_plus_gr["college"], upper=True)
+enroll_plus_gr["degree_key"]  = _norm_key(enroll_plus_gr["degr"], upper=True)
+enroll_plus_gr["major_key"]   = _norm_key(enroll_plus_gr["majr"], upper=True)
 
-program_data["college_key"] = program_data["COLLEGE"].astype(str).str.strip().str.upper()
-program_data["degree_key"]  = program_data["DEGREE"].astype(str).str.strip().str.upper()
-program_data["major_key"]   = program_data["MAJOR"].astype(str).str.strip().str.upper()
+program_data["college_key"] = _norm_key(program_data["COLLEGE"], upper=True)
+program_data["degree_key"]  = _norm_key(program_data["DEGREE"], upper=True)
+program_data["major_key"]   = _norm_key(program_data["MAJOR"], upper=True)
 
 # Left join to add PROGRAM
 df_final = enroll_plus_gr.merge(
@@ -134,6 +163,11 @@ matched_programs = df_final["PROGRAM"].notna().sum()
 total_rows = len(df_final)
 print(f"[MERGE] PROGRAM matched for {matched_programs} of {total_rows} records.")
 print(f"[MERGE] PROGRAM missing for {total_rows - matched_programs} records.")
+
+# Prune to the census payload Step 5 uses (helper keys and Step 3 course_count were diagnostics only)
+CENSUS_COLS = ["majr", "degr", "college", "PROGRAM",
+               "race_desc", "ethn_desc", "visa_desc", "legal_sex_desc", "birth_date"]
+df_final = df_final[["id", "term_code", "census", *CENSUS_COLS]]
 # -----------------------------
 # Step 5 — Term GPA, census flags, DU-defined demographics, and age
 # -----------------------------
@@ -145,43 +179,34 @@ GRADE_POINTS = {
     "C+": 2.3, "C": 2.0, "C-": 1.7,
     "D+": 1.3, "D": 1.0, "F": 0.0
 }
-grades_gpa = grades.copy()
-grades_gpa["final_course_grade"] = grades_gpa["final_course_grade"].astype(str).str.strip()
-grades_gpa["grade_points"] = grades_gpa["final_course_grade"].map(GRADE_POINTS)
-grades_gpa = grades_gpa.dropna(subset=["grade_points"])
-
+# Categorical codes index a small lookup table; grades outside the scale (e.g., D-) get code -1 → NaN
+grade_letter = _norm_key(grades["final_course_grade"])
+grade_codes = (grade_letter.where(grade_letter.isin(list(GRADE_POINTS)))
+               .astype(pd.CategoricalDtype(list(GRADE_POINTS)))
+               .cat.codes.to_numpy())
+grade_lut = np.array(list(GRADE_POINTS.values()))
+grade_points = np.where(grade_codes >= 0, grade_lut[grade_codes], np.nan)
+
+# One unsorted groupby; NaN points are skipped by mean/count (terms with no graded courses dropped)
 term_gpa = (
-    grades_gpa.groupby(["id", "term_code"], as_index=False)
-              .agg(term_gpa=("grade_points", "mean"),
-                   course_count=("grade_points", "size"))
+    grades.assign(grade_points=grade_points)
+          .groupby(["id", "term_code"], as_index=False, sort=False, observed=True)
+          .agg(term_gpa=("grade_points", "mean"),
+               course_count=("grade_points", "count"))
+          .query("course_count > 0")
 )
 print("[INFO] term_gpa rows:", term_gpa.shape[0])
 
-# 5b) Split census exactly as provided: WK3 vs EOT
-w3 = (df_final[df_final["census"] == "WK3"]
-      .sort_values(["id", "term_code"])
-      .drop_duplicates(["id", "term_code"])[
-          ["id","term_code","majr","degr","college","PROGRAM",
-           "race_desc","ethn_desc","visa_desc","legal_sex_desc","birth_date"]
-      ].rename(columns={
-          "majr":"majr_w3","degr":"degr_w3","college":"college_w3","PROGRAM":"PROGRAM_w3",
-          "race_desc":"race_desc_w3","ethn_desc":"ethn_desc_w3","visa_desc":"visa_desc_w3",
-          "legal_sex_desc":"legal_sex_desc_w3","birth_date":"birth_date_w3"
-      }))
-
-end = (df_final[df_final["census"] == "EOT"]
-       .sort_values(["id", "term_code"])
-       .drop_duplicates(["id", "term_code"])[
-           ["id","term_code","majr","degr","college","PROGRAM",
-            "race_desc","ethn_desc","visa_desc","legal_sex_desc","birth_date"]
-       ].rename(columns={
-           "majr":"majr_end","degr":"degr_end","college":"college_end","PROGRAM":"PROGRAM_end",
-           "race_desc":"race_desc_end","ethn_desc":"ethn_desc_end","visa_desc":"visa_desc_end",
-           "legal_sex_desc":"legal_sex_desc_end","birth_date":"birth_date_end"
-       }))
-
-# 5c) Merge WK3 and EOT; create flags
-student_term = pd.merge(w3, end, on=["id", "term_code"], how="outer")
+# 5b) Split census exactly as provided: WK3 vs EOT — one dedup + pivot to wide
+CENSUS_SUFFIX = {"WK3": "w3", "EOT": "end"}
+wide = (df_final[df_final["census"].isin(list(CENSUS_SUFFIX))]
+        .drop_duplicates(["id", "term_code", "census"])
+        .pivot(index=["id", "term_code"], columns="census", values=CENSUS_COLS)
+        .reindex(columns=pd.MultiIndex.from_product([CENSUS_COLS, list(CENSUS_SUFFIX)])))
+wide.columns = [f"{col}_{CENSUS_SUFFIX[census]}" for col, census in wide.columns]
+
+# 5c) WK3 and EOT side by side per (id, term_code); create flags
+student_term = wide.reset_index()
 
 student_term["enrolled_w3"]  = student_term[["majr_w3","degr_w3","college_w3"]].notna().any(axis=1)
 student_term["enrolled_end"] = student_term[["majr_end","degr_end","college_end"]].notna().any(axis=1)
@@ -194,77 +219,64 @@ student_term["undeclared_to_declared"] = (
     ~student_term["majr_end"].fillna("").str.upper().str.startswith("UN")
 )
 
-# Prefer EOT info if they persisted; otherwise fall back to WK3
-student_term["PROGRAM"] = np.where(student_term["enrolled_end"], student_term["PROGRAM_end"], student_term["PROGRAM_w3"])
-student_term["degree"]  = np.where(student_term["enrolled_end"], student_term["degr_end"],    student_term["degr_w3"])
-student_term["major"]   = np.where(student_term["enrolled_end"], student_term["majr_end"],    student_term["majr_w3"])
-student_term["college"] = np.where(student_term["enrolled_end"], student_term["college_end"], student_term["college_w3"])
-student_term["gender"]  = np.where(student_term["legal_sex_desc_end"].notna(),
-                                   student_term["legal_sex_desc_end"], student_term["legal_sex_desc_w3"])
+# Prefer EOT info where present; otherwise fall back to WK3
+for out_col, src in [("PROGRAM", "PROGRAM"), ("degree", "degr"), ("major", "majr"),
+                     ("college", "college"), ("gender", "legal_sex_desc")]:
+    student_term[out_col] = student_term[f"{src}_end"].combine_first(student_term[f"{src}_w3"])
 
 # 5f) Race/ethnicity (visa → ethnicity → race). Missing/blank visa ≠ International.
 NON_INTL_VISA_TYPES = {"PR", "RF", "AS"}  # only present AND not in this set → International
 
-def _race_ethnicity_du(row) -> str:
-    # Prefer WK3 values; fallback to EOT
-    visa_raw = row.get("visa_desc_w3") if pd.notna(row.get("visa_desc_w3")) else row.get("visa_desc_end")
-    ethn_raw = row.get("ethn_desc_w3") if pd.notna(row.get("ethn_desc_w3")) else row.get("ethn_desc_end")
-    race_raw = row.get("race_desc_w3") if pd.notna(row.get("race_desc_w3")) else row.get("race_desc_end")
-
-    # Clean only if non-missing and non-blank; otherwise set ""
-    visa = (str(visa_raw).strip().upper() if (pd.notna(visa_raw) and str(visa_raw).strip() != "") else "")
-    ethn = (str(ethn_raw).strip()            if (pd.notna(ethn_raw) and str(ethn_raw).strip() != "") else "")
-    race = (str(race_raw).strip()            if (pd.notna(race_raw) and str(race_raw).strip() != "") else "")
-
-    # 1) Visa precedence
-    if visa and visa not in NON_INTL_VISA_TYPES:
-        return "International"   # e.g., B1, J1, R1
-
-    # 2) Ethnicity
-    if ethn.lower() == "hispanic or latino":
-        return "Hispanic or Latino"
+# Prefer WK3 values; fallback to EOT. Trim so blanks compare as "".
+visa = student_term["visa_desc_w3"].fillna(student_term["visa_desc_end"]).astype("string").str.strip().str.upper()
+ethn = student_term["ethn_desc_w3"].fillna(student_term["ethn_desc_end"]).astype("string").str.strip()
+race = student_term["race_desc_w3"].fillna(student_term["race_desc_end"]).astype("string").str.strip()
 
-    # 3) Otherwise race (or Unknown)
-    return race if race else "Unknown"
+# 1) Visa precedence (e.g., B1, J1, R1) → 2) Ethnicity → 3) Otherwise race (or Unknown)
+is_intl = (visa.fillna("") != "") & ~visa.isin(NON_INTL_VISA_TYPES)
+is_hisp = ethn.str.lower().eq("hispanic or latino").fillna(False)
+has_race = race.fillna("") != ""
 
-student_term["race_ethnicity"] = student_term.apply(_race_ethnicity_du, axis=1)
+student_term["race_ethnicity"] = np.select(
+    [is_intl, is_hisp, has_race],
+    ["International", "Hispanic or Latino", race.fillna("").to_numpy(dtype=object)],
+    default="Unknown"
+)
 
 
 # 5e) Age — month-level anchor 
 # Map DU term-code suffixes to an "as-of" month; use day=1 to avoid overprecision.
 _TERM_ASOF_MONTH = {10: 10, 70: 10, 20: 3, 30: 7, 40: 7, 50: 7}  # Fall=Oct, Spring=Mar, Summer=Jul
 
-def _asof_from_term(term_code):
-    s = str(term_code)
-    if len(s) >= 6 and s[:4].isdigit():
-        year = int(s[:4])
-        try:
-            suff = int(s[-2:])
-        except ValueError:
-            return pd.NaT
-        month = _TERM_ASOF_MONTH.get(suff, 10)  # default to Oct if unknown
-        return pd.Timestamp(year=year, month=month, day=1)
-    return pd.NaT
-
-def _age_years(dob_w3, dob_end, term_code):
-    dob = dob_w3 if pd.notna(dob_w3) else dob_end
-    dt = pd.to_datetime(dob, errors="coerce")
-    asof = _asof_from_term(term_code)
-    if pd.isna(dt) or pd.isna(asof):
-        return np.nan
-    # integer age at as-of date (month-level anchor)
-    years = asof.year - dt.year
-    if (asof.month, asof.day) < (dt.month, dt.day):
-        years -= 1
-    return years
-
-student_term["age"] = student_term.apply(
-    lambda r: _age_years(r.get("birth_date_w3"), r.get("birth_date_end"), r.get("term_code")),
-    axis=1
-)
+# As-of date per distinct term code (YYYY + suffix, e.g. 202170 → 2021-10-01), mapped back to rows
+term_codes = student_term["term_code"].drop_duplicates()
+tc = term_codes.astype(str)
+valid_tc = (tc.str.len() >= 6) & tc.str[:4].str.isdigit()
+year = pd.to_numeric(tc.str[:4].where(valid_tc), errors="coerce")
+suff = pd.to_numeric(tc.str[-2:].where(valid_tc), errors="coerce")
+month = suff.map(_TERM_ASOF_MONTH).fillna(10)  # default to Oct if unknown
+asof_by_term = pd.to_datetime(
+    pd.DataFrame({"year": year, "month": month, "day": 1}).where(suff.notna()),
+    errors="coerce"
+).set_axis(term_codes.to_numpy())
+asof = student_term["term_code"].map(asof_by_term).astype(asof_by_term.dtype)  # categorical key → datetime
+
+# Prefer WK3 birth date; fallback to EOT
+dob = pd.to_datetime(student_term["birth_date_w3"].fillna(student_term["birth_date_end"]), errors="coerce")
+
+# integer age at as-of date (month-level anchor)
+before_bday = (asof.dt.month < dob.dt.month) | ((asof.dt.month == dob.dt.month) & (asof.dt.day < dob.dt.day))
+student_term["age"] = (asof.dt.year - dob.dt.year - before_bday.astype(int)).astype("Int64")
 
 
 # 5f) Attach term GPA
+# Drop the per-census _w3/_end source columns first; only the derived fields go through the join
+student_term = student_term[[
+    "id", "term_code",
+    "gender", "race_ethnicity", "age",
+    "college", "degree", "major", "PROGRAM",
+    "persisted_w3_to_end", "undeclared_to_declared"
+]]
 student_term = student_term.merge(term_gpa, on=["id","term_code"], how="left", validate="m:1")
 
 print("[BUILD] student_term:", student_term.shape)